@@ -30,6 +30,8 @@ def random_unitary_matrix(dim: int, seed: int):
 def verify_kraus_unitarity(kraus_ops, *, tbw_tol=1e-6):
     assert len(kraus_ops.shape) in (2, 3)
     dim_hilbert = kraus_ops.shape[1]
-    op_products = np.sum([kraus.conj().T.dot(kraus)
-                          for kraus in kraus_ops], axis=0)
+    if len(kraus_ops.shape) == 2:
+        op_products = np.einsum('ij,ij->', kraus_ops.conj(), kraus_ops)
+    else:
+        op_products = np.einsum('kji,kjl->il', kraus_ops.conj(), kraus_ops)
     return np.sum(op_products)/dim_hilbert - 1 < tbw_tol
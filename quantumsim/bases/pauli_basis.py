@@ -5,6 +5,9 @@
 
 import numpy as np
 
+# Same bound as `np.allclose(x, 1)` with its default `atol` and `rtol`
+_UNIT_SUM_TOLERANCE = 1e-8 + 1e-5
+
 
 class PauliBasis:
     """Defines a Pauli basis.
@@ -98,7 +101,7 @@ class PauliBasis:
 
     @staticmethod
     def _to_unit_vector(v):
-        if np.allclose(np.sum(v), 1):
+        if abs(np.sum(v) - 1) <= _UNIT_SUM_TOLERANCE:
             rounded = np.round(v, 8)
             nz, = np.nonzero(rounded)
             if len(nz) == 1:
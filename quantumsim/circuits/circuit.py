@@ -117,10 +117,10 @@ class CircuitBase(ABC):
                  for q in shared_qubits)) + 2*other.time_start)
         else:
             other_shifted = copy(other)
-        qubits = tuple(chain(self.qubits,
-                             (q for q in other.qubits if q not in self.qubits)))
-        gates = tuple(chain((copy(g) for g in self.gates),
-                            other_shifted.gates))
+        # Circuit constructor materializes both iterables itself
+        qubits = chain(self.qubits,
+                       (q for q in other.qubits if q not in self.qubits))
+        gates = chain((copy(g) for g in self.gates), other_shifted.gates)
         return Circuit(qubits, gates)
 
     def __call__(self, **kwargs):
@@ -170,7 +170,7 @@ class CircuitBase(ABC):
 
 
 class Gate(CircuitBase):
-    _valid_identifier_re = re.compile('[a-zA-Z_][a-zA-Z0-9_]*')
+    _valid_identifier_re = re.compile(r'[a-zA-Z_]\w*', re.ASCII)
     _sympify_locals = {
         'beta': symbols('beta'),
         'gamma': symbols('gamma'),
@@ -323,9 +323,9 @@ class Circuit(CircuitBase, ABC):
 
     def operation_sympified(self):
         operations = []
+        qubit_index = {qubit: i for i, qubit in enumerate(self._qubits)}
         for gate in self._gates:
-            qubit_indices = tuple(self._qubits.index(qubit) for qubit in
-                                  gate.qubits)
+            qubit_indices = tuple(qubit_index[qubit] for qubit in gate.qubits)
             operations.append(gate.operation_sympified().at(*qubit_indices))
         return Operation.from_sequence(operations)
 
@@ -241,16 +241,21 @@ class Node:
 class CompilerQueue:
     def __init__(self, iterable=None):
         self._queue = deque([])
+        # Mirrors the queue contents for constant-time membership checks
+        self._queued = set()
         if iterable:
             for item in iterable:
                 self.add(item)
 
     def add(self, item):
-        if item not in self._queue:
+        if item not in self._queued:
             self._queue.append(item)
+            self._queued.add(item)
 
     def get(self):
-        return self._queue.popleft()
+        item = self._queue.popleft()
+        self._queued.remove(item)
+        return item
 
     def __len__(self):
         return len(self._queue)
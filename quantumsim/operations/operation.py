@@ -5,6 +5,7 @@ import re
 import numpy as np
 import scipy.linalg.matfuncs
 from collections import namedtuple
+from functools import lru_cache
 from itertools import chain as chain_
 
 from copy import copy
@@ -171,8 +172,10 @@ class Operation(metaclass=abc.ABCMeta):
                 .format(dim_hilbert ** num_qubits,
                         kraus.shape[1], kraus.shape[2]))
 
-        return Operation.from_ptm(kraus_to_ptm(kraus, bases_in, bases_out),
-                                  bases_in, bases_out)
+        kraus = np.ascontiguousarray(kraus)
+        ptm = _kraus_to_ptm_cached(kraus.tobytes(), kraus.shape, kraus.dtype,
+                                   tuple(bases_in), tuple(bases_out))
+        return Operation.from_ptm(ptm, bases_in, bases_out)
 
     @staticmethod
     def from_lindblad_form(time, bases_in, bases_out=None, *,
@@ -380,6 +383,16 @@ class Operation(metaclass=abc.ABCMeta):
 IndexedOperation = namedtuple('IndexedOperation', ['operation', 'indices'])
 
 
+@lru_cache(maxsize=256)
+def _kraus_to_ptm_cached(kraus_bytes, shape, dtype, bases_in, bases_out):
+    """Kraus to PTM conversion, memoized on the raw bytes of Kraus
+    operators, so that repeatedly constructed gates share a single PTM."""
+    kraus = np.frombuffer(kraus_bytes, dtype=dtype).reshape(shape)
+    ptm = kraus_to_ptm(kraus, bases_in, bases_out)
+    ptm.setflags(write=False)
+    return ptm
+
+
 class Placeholder(Operation):
     """
     Parameters
@@ -459,6 +472,12 @@ class PTMOperation(Operation):
     bases_out : tuple of PauliBasis
         Output bases of the PTM
 
+    Notes
+    -----
+    The PTM is stored as a read-only array, that is shared between copies
+    of the operation and returned by :func:`PTMOperation.ptm` without
+    copying. Make a copy, if you need to modify it.
+
     References
     ----------
     .. [1] M. A. Nielsen, I. L. Chuang, "Quantum Computation and Quantum
@@ -467,7 +486,8 @@ class PTMOperation(Operation):
        arXiv:1509.02921 (2000).
     """
     def __init__(self, ptm, bases_in, bases_out):
-        self._ptm = ptm
+        self._ptm = ptm.view()
+        self._ptm.setflags(write=False)
         self.bases_in = bases_in
         self.bases_out = bases_out
         self._dim_hilbert = bases_in[0].dim_hilbert
@@ -624,7 +644,7 @@ class _Chain(Operation):
 
 
 class ParametrizedOperation(Placeholder):
-    _valid_identifier_re = re.compile('[a-zA-Z_][a-zA-Z0-9_]*')
+    _valid_identifier_re = re.compile(r'[a-zA-Z_]\w*', re.ASCII)
 
     def __init__(self, operation_func, bases_in, bases_out=None):
         """A gate without notion of timing.
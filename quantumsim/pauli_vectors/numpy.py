@@ -1,12 +1,31 @@
 import warnings
+from functools import lru_cache
 
 import numpy as np
 import pytools
 from .pauli_vector import PauliVectorBase
 
 
+@lru_cache(maxsize=128)
+def _einsum_path(key):
+    """Greedy contraction path for `np.einsum` in the interleaved form.
+
+    The path depends only on the shapes of operands and on the indices, so
+    `key` is a tuple of `(shape, indices)` pairs for every operand, followed
+    by the output indices. Zero-stride dummy operands of these shapes are
+    used to compute it.
+    """
+    args = []
+    for shape, idx in key[:-1]:
+        args.append(np.broadcast_to(0., shape))
+        args.append(list(idx))
+    args.append(list(key[-1]))
+    path, _ = np.einsum_path(*args, optimize=True)
+    return path
+
+
 class PauliVectorNumpy(PauliVectorBase):
-    def __init__(self, bases, pv=None, *, force=False):
+    def __init__(self, bases, pv=None, *, force=False, dtype=None):
         """A density matrix describing several subsystems with variable number
         of dimensions.
 
@@ -19,6 +38,18 @@ class PauliVectorNumpy(PauliVectorBase):
             Must be of size (2**no_qubits, 2**no_qubits). Only upper triangle
             is relevant.  If data is `None`, create a new density matrix with
             all qubits in ground state.
+
+        dtype : numpy.dtype or None
+            Floating point type to store the Pauli vector in. If set, the
+            storage type is kept throughout the computation and PTMs are
+            rounded to it on application. Single precision halves memory
+            consumption and bandwidth at a cost of accuracy. States obtained
+            with :func:`partial_trace` and :func:`copy` keep it, but
+            :func:`diagonal` and :func:`meas_prob` return double precision
+            values, since basis vectors are stored as `complex128`. If
+            `None`, `pv` is used as is (double precision for a new density
+            matrix) and is promoted by the usual Numpy rules on PTM
+            application.
         """
         super().__init__(bases, pv, force=force)
         if pv is not None:
@@ -33,11 +64,18 @@ class PauliVectorNumpy(PauliVectorBase):
                     '`pv` must have floating point data type, got {}'
                     .format(pv.dtype)
                 )
+        if dtype is not None and \
+                np.dtype(dtype) not in (np.float16, np.float32, np.float64):
+            raise ValueError(
+                '`dtype` must be a floating point data type, got {}'
+                .format(dtype))
+        self._dtype = None if dtype is None else np.dtype(dtype)
 
         if isinstance(pv, np.ndarray):
-            self._data = pv
+            self._data = pv if dtype is None else pv.astype(dtype, copy=False)
         elif pv is None:
-            self._data = np.zeros(self.dim_pauli)
+            self._data = np.zeros(
+                self.dim_pauli, dtype=np.float64 if dtype is None else dtype)
             self._data[tuple([0] * self.n_qubits)] = 1
         else:
             raise ValueError(
@@ -59,9 +97,10 @@ class PauliVectorNumpy(PauliVectorBase):
         dm_out_idx = list(dm_in_idx)
         for i_in, i_out in zip(ptm_in_idx, ptm_out_idx):
             dm_out_idx[i_in] = i_out
-        self._data = np.einsum(
-            self._data, dm_in_idx, ptm, ptm_out_idx + ptm_in_idx, dm_out_idx,
-            optimize=True)
+        if self._dtype is not None:
+            ptm = ptm.astype(self._dtype, copy=False)
+        self._data = self._einsum(
+            self._data, dm_in_idx, ptm, ptm_out_idx + ptm_in_idx, dm_out_idx)
 
     def diagonal(self, *, get_data=True):
         no_trace_tensors = [basis.computational_basis_vectors
@@ -76,12 +115,18 @@ class PauliVectorNumpy(PauliVectorBase):
         indices = list(range(n_qubits))
         out_indices = list(range(n_qubits, 2 * n_qubits))
         complex_dm_dimension = pytools.product(self.dim_hilbert)
-        return np.einsum(self._data, indices, *trace_argument, out_indices,
-                         optimize=True).real.reshape(complex_dm_dimension)
+        return self._einsum(self._data, indices, *trace_argument,
+                            out_indices).real.reshape(complex_dm_dimension)
 
     def trace(self):
-        # TODO: can be made more effective
-        return np.sum(self.diagonal())
+        # Contract each qubit index with traces of its basis elements,
+        # instead of computing the full diagonal first.
+        einsum_args = [self._data, list(range(self.n_qubits))]
+        for i, b in enumerate(self.bases):
+            einsum_args.append(b.computational_basis_vectors.sum(axis=0))
+            einsum_args.append([i])
+        einsum_args.append([])
+        return np.float64(self._einsum(*einsum_args).real)
 
     def partial_trace(self, *qubits):
         for q in qubits:
@@ -91,8 +136,10 @@ class PauliVectorNumpy(PauliVectorBase):
             if i not in qubits:
                 einsum_args.append(b.vectors)
                 einsum_args.append([i, self.n_qubits+i, self.n_qubits+i])
-        traced_dm = np.einsum(*einsum_args, optimize=True).real
-        return self.__class__([self.bases[q] for q in qubits], traced_dm)
+        einsum_args.append(list(qubits))
+        traced_dm = self._einsum(*einsum_args).real
+        return self.__class__([self.bases[q] for q in qubits], traced_dm,
+                              dtype=self._dtype)
 
     def meas_prob(self, qubit):
         self._validate_qubit(qubit, 'qubit')
@@ -102,14 +149,14 @@ class PauliVectorNumpy(PauliVectorBase):
             einsum_args.append([i, self.n_qubits+i, self.n_qubits+i])
         einsum_args.append([self.n_qubits + qubit])
         try:
-            return np.einsum(*einsum_args, optimize=True).real
+            return self._einsum(*einsum_args).real
         except Exception:
             raise
 
     def renormalize(self):
         tr = self.trace()
         if tr > 1e-8:
-            self._data *= self.trace() ** -1
+            self._data *= tr ** -1
         else:
             warnings.warn(
                 "Density matrix trace is 0; likely your further computation "
@@ -117,5 +164,18 @@ class PauliVectorNumpy(PauliVectorBase):
         return tr
 
     def copy(self):
-        return self.from_pv(self.to_pv().copy(), self.bases)
+        return self.__class__(self.bases, self._data.copy(), dtype=self._dtype)
+
+    @staticmethod
+    def _einsum(*args):
+        """Same as `np.einsum` in the interleaved operand/indices form,
+        but with the contraction path looked up in a bounded cache.
+        Output indices must be passed explicitly as the last argument.
+        """
+        if len(args) % 2 == 0:
+            raise ValueError('`_einsum` requires explicit output indices')
+        key = tuple((op.shape, tuple(idx))
+                    for op, idx in zip(args[:-1:2], args[1::2])) + \
+            (tuple(args[-1]),)
+        return np.einsum(*args, optimize=_einsum_path(key))
 
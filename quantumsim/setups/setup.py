@@ -23,6 +23,7 @@ class Setup:
             setup_dict = yaml.safe_load(setup)
 
         self._qubits = {}
+        self._params = {}
         self._gates = defaultdict(dict)
 
         self.name = setup_dict.get('name', '')
@@ -48,19 +49,21 @@ class Setup:
                 raise SetupLoadError(what + ' defined repeatedly in the setup.')
             self._qubits[qubits] = params_dict
 
+        # Merge defaults into per-qubit parameters once, so that lookups in
+        # `param` need a single dictionary access.
+        defaults = self._qubits.get(tuple(), {})
+        self._params = {qubits: {**defaults, **params_dict}
+                        for qubits, params_dict in self._qubits.items()}
+        self._params[tuple()] = defaults
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, 'r') as f:
             return cls(f)
 
     def param(self, param, *qubits):
-        try:
-            return self._qubits[qubits][param]
-        except KeyError:
-            pass
-        try:
-            return self._qubits[tuple()][param]
-        except KeyError:
-            pass
+        params = self._params.get(qubits, self._params[tuple()])
+        if param in params:
+            return params[param]
         raise KeyError('Parameter "{}" is not defined for qubit(s) {}'
                        .format(param, ", ".join(qubits)))
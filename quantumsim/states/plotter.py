@@ -1,7 +1,16 @@
 import numpy as np
+from functools import lru_cache
 from itertools import product
 
 
+@lru_cache(maxsize=32)
+def _ket_labels(dims):
+    """Axis labels for all computational basis states of qubits with
+    Hilbert dimensionalities `dims`."""
+    return tuple(r'$\left| %s \right\rangle$' % ''.join(map(str, state))
+                 for state in product(*(range(d) for d in dims)))
+
+
 def plot(state, *, ax=None, truncate_levels=None, colorbar=True, amp_limits=None, phase_limits=None):
     """
     Plots the density matrix as a complext 3D histogram.
@@ -61,20 +70,17 @@ def plot(state, *, ax=None, truncate_levels=None, colorbar=True, amp_limits=None
         rho = _rho
         dim = pv.dim_hilbert
 
-    def tuple_to_string(tup):
-        state = ''.join(str(x) for x in tup)
-        return r'$\left| %s \right\rangle$' % state
-
-    labels = [tuple_to_string(x) for x in product(*(range(d) for d in dim))]
+    labels = _ket_labels(tuple(dim))
 
     if phase_limits and isinstance(phase_limits, (list, tuple)):
         assert len(phase_limits) == 2
     else:
         phase_limits = (-np.pi, np.pi)
 
+    rho_flat = rho.ravel()
     norm = Normalize(*phase_limits)
     cmap = plt.get_cmap('plasma')
-    colors = cmap(norm(np.angle(rho.flatten())))
+    colors = cmap(norm(np.angle(rho_flat)))
 
     if amp_limits and isinstance(phase_limits, (list, tuple)):
         assert len(amp_limits) == 2
@@ -82,11 +88,11 @@ def plot(state, *, ax=None, truncate_levels=None, colorbar=True, amp_limits=None
         amp_limits = (0, 1)
 
     xpos, ypos = np.meshgrid(*(range(dim) for dim in rho.shape))
-    xpos = xpos.flatten()
-    ypos = ypos.flatten()
+    xpos = xpos.ravel()
+    ypos = ypos.ravel()
     zpos = 0
     dx = dy = 0.5 * np.ones(rho.size)
-    dz = np.real(rho.flatten())
+    dz = rho_flat.real
 
     ax.bar3d(xpos, ypos, zpos, dx, dy, dz, color=colors)
     ax.set_zlim3d(amp_limits)
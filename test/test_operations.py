@@ -194,6 +194,25 @@ class TestOperations:
         op_3q(state2, 0, 1, 2)
         assert np.allclose(state1.to_pv(), state2.to_pv())
 
+    def test_ptm_shared_read_only(self):
+        b = (bases.general(2),)
+        op = lib2.rotate_x(0.5)
+        op_copy = copy(op)
+        ptm = op.ptm(b)
+        assert np.shares_memory(ptm, op_copy.ptm(b))
+        with pytest.raises(ValueError):
+            ptm[0, 0] = 0.
+
+        data = np.identity(4)
+        op = Operation.from_ptm(data, b)
+        assert not op.ptm(b).flags.writeable
+        assert data.flags.writeable
+
+        op1 = lib2.cphase(0.25)
+        op2 = lib2.cphase(0.25)
+        assert np.shares_memory(op1.ptm(b*2), op2.ptm(b*2))
+        assert not np.shares_memory(op1.ptm(b*2), lib2.cphase(0.5).ptm(b*2))
+
     def test_lindblad_singlequbit(self):
         ham = random_hermitian_matrix(2, seed=56)
         lindblad_ops = np.array([
@@ -14,6 +14,7 @@ import numpy as np
 from pytest import approx
 from scipy.stats import unitary_group
 from quantumsim.algebra import kraus_to_ptm, ptm_convert_basis
+from quantumsim.pauli_vectors import PauliVectorNumpy
 
 
 @pytest.fixture(params=[
@@ -306,3 +307,49 @@ class TestPauliVectors:
         assert s.bases[1] == bases[1]
         assert np.allclose(s.diagonal(), diag)
 
+
+class TestPauliVectorNumpy:
+    def test_single_precision(self):
+        b = (quantumsim.bases.general(2),)
+        bases = b * 2
+        unitary = random_unitary_matrix(4, 45)
+        ptm = kraus_to_ptm(unitary.reshape(1, 4, 4), bases, bases)
+
+        pv64 = PauliVectorNumpy(bases)
+        pv32 = PauliVectorNumpy(bases, dtype=np.float32)
+        assert pv32.to_pv().dtype == np.float32
+        pv64.apply_ptm(ptm, 0, 1)
+        pv32.apply_ptm(ptm, 0, 1)
+        assert pv32.to_pv().dtype == np.float32
+        assert pv32.copy().to_pv().dtype == np.float32
+        assert pv32.to_pv() == approx(pv64.to_pv(), abs=1e-6)
+        assert pv32.diagonal() == approx(pv64.diagonal(), abs=1e-6)
+        assert pv32.diagonal().dtype == np.float64
+        assert pv32.partial_trace(0).to_pv().dtype == np.float32
+        assert pv64.partial_trace(0).to_pv().dtype == np.float64
+
+        pv = PauliVectorNumpy(bases, pv64.to_pv(), dtype=np.float32)
+        assert pv.to_pv().dtype == np.float32
+
+        # Without explicit `dtype` PTM application promotes the type
+        pv = PauliVectorNumpy(bases, pv64.to_pv().astype(np.float32))
+        assert pv.to_pv().dtype == np.float32
+        pv.apply_ptm(ptm, 0, 1)
+        assert pv.to_pv().dtype == np.float64
+        with pytest.raises(ValueError):
+            PauliVectorNumpy(bases, dtype=complex)
+
+    def test_partial_trace(self):
+        bases = (quantumsim.bases.general(2),) * 3
+        dm = random_density_matrix(8, 83)
+        pv = PauliVectorNumpy.from_dm(dm, bases)
+        dm = dm.reshape((2,) * 6)
+
+        traced = pv.partial_trace(0)
+        assert traced.n_qubits == 1
+        assert traced.to_dm() == approx(np.einsum('abcdbc->ad', dm))
+
+        traced = pv.partial_trace(2, 0)
+        assert traced.n_qubits == 2
+        assert traced.to_dm().reshape((2,) * 4) == \
+            approx(np.einsum('abcdbf->cafd', dm))